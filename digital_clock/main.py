@@ -1,33 +1,61 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import datetime
-import time
+from string import Template
+
+# Clock rendered and ticked in the browser, so no script rerun is needed each second
+CLOCK_HTML = Template("""
+<div style="text-align: center; font-family: sans-serif;">
+    <h1 id="time" style="font-size: 72px; margin: 0;">$time</h1>
+    <h3 id="date" style="margin: 0;">$date</h3>
+</div>
+<script>
+    const use24 = $use_24;
+    const pad = (n) => String(n).padStart(2, "0");
+    function tick() {
+        const d = new Date();
+        const h = d.getHours();
+        const clock = pad(d.getMinutes()) + ":" + pad(d.getSeconds());
+        document.getElementById("time").innerText = use24
+            ? pad(h) + ":" + clock
+            : pad(h % 12 || 12) + ":" + clock + ":" + (h < 12 ? "AM" : "PM");
+        document.getElementById("date").innerText =
+            d.toLocaleString("en-US", {month: "long"}) + ":" + pad(d.getDate()) + ":" + d.getFullYear();
+    }
+    tick();
+    setInterval(tick, 1000);
+</script>
+""")
 
 class DigitalClock:
     """A digital clock that provides time functionality"""
 
     def __init__(self,use_24_hr_format=False):
         self.use_24_hr_format=use_24_hr_format
+        self._time_fmt=self._select_time_format()
+        self._date_fmt="%B:%d:%Y"
+        self._now=datetime.datetime.now
+
+    def _select_time_format(self):
+        """Get the strftime format for the current hour format"""
+        return "%H:%M:%S" if self.use_24_hr_format else "%I:%M:%S:%p"
 
     def get_current_time(self):
          """Get the current time
             Returns:
             str: Formatted current time string"""
-         now=datetime.datetime.now()
-         if self.use_24_hr_format:
-             return now.strftime("%H:%M:%S")
-         else:
-             return now.strftime("%I:%M:%S:%p")
+         return self._now().strftime(self._time_fmt)
          
     def get_current_date(self):
         """Get the current date
             Returns:
             str: Formatted current date string"""
-        now=datetime.datetime.now()
-        return now.strftime("%B:%d:%Y")
+        return self._now().strftime(self._date_fmt)
     
     def toggle_format(self):
         """Toggle between 12 hour and 24-hour formats"""
         self.use_24_hr_format=not self.use_24_hr_format
+        self._time_fmt=self._select_time_format()
         return self.use_24_hr_format
     
 def main():
@@ -54,17 +82,12 @@ def main():
         format_text="24-Hour" if st.session_state.clock.use_24_hr_format else "12-Hour"
         st.write(f"Currently using {format_text} format")
 
-    time_placeholder=st.empty()
-    date_placeholder=st.empty()
-
-    while True:
-        current_time=st.session_state.clock.get_current_time()
-        current_date=st.session_state.clock.get_current_date()
-
-        time_placeholder.markdown(f"<h1 style='text-align: center; font-size: 72px;'>{current_time}</h1>",unsafe_allow_html=True)
-        date_placeholder.markdown(f"<h3 style='text-align: center;'>{current_date}</h3>", unsafe_allow_html=True)
-
-        time.sleep(1)
+    clock=st.session_state.clock
+    components.html(CLOCK_HTML.substitute(
+        time=clock.get_current_time(),
+        date=clock.get_current_date(),
+        use_24="true" if clock.use_24_hr_format else "false"
+    ),height=150)
 
 if __name__=="__main__":
     main()
\ No newline at end of file
@@ -1,44 +1,123 @@
 import streamlit as st
 import pandas as pd
-import json
+import numpy as np
+import bisect
+import itertools
 import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional
 
+# Prefer a C-accelerated JSON codec for the mutation log and legacy JSON
+# snapshots; every codec here reads and writes bytes
+try:
+    import orjson
+    _LOADS = orjson.loads
+    _DUMPS = orjson.dumps
+except ImportError:
+    try:
+        from pandas.io.json import ujson_loads as _LOADS, ujson_dumps as _ujson_dumps
+        _DUMPS = lambda obj: _ujson_dumps(obj, double_precision=15).encode()
+    except ImportError:
+        import json
+        _LOADS = json.loads
+        _DUMPS = lambda obj: json.dumps(obj).encode()
+
+# Stream legacy JSON snapshots product by product when ijson is installed
+try:
+    import ijson
+    _JSON_ERRORS = (ValueError, KeyError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError, KeyError)
+
+# Shared across managers so a version number identifies one inventory state
+_VERSIONS = itertools.count()
+
+CATEGORIES = ("Electronics", "Clothing", "Food", "Furniture", "Office Supplies", "Other")
+CATEGORY_IDX = {category: i for i, category in enumerate(CATEGORIES)}
+OTHER = CATEGORY_IDX["Other"]
+
+# Last formatted (second, timestamp) pair, reused for every mutation within
+# the same second; rebound as a whole so concurrent readers never see a mix
+_TS_CACHE = (0, "")
+
+
+def _now_str():
+    """Get the current local time formatted to the second
+    
+    Returns:
+        str: Timestamp as "YYYY-MM-DD HH:MM:SS"
+    """
+    global _TS_CACHE
+    t = int(time.time())
+    cached_t, cached_s = _TS_CACHE
+    if t != cached_t:
+        cached_s = datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
+        _TS_CACHE = (t, cached_s)
+    return cached_s
+
+
+def _trigrams(*texts):
+    """Get every three-character substring of the given strings
+    
+    Returns:
+        set: Trigrams found in any of the strings
+    """
+    return {text[i:i + 3] for text in texts for i in range(len(text) - 2)}
+
+
+_PRODUCT_KEYS = ("product_id", "name", "category", "quantity", "price", "last_updated")
+
+
+@dataclass(slots=True, eq=False)
 class Product:
-    """Class representing a product in the inventory"""
+    """Class representing a product in the inventory
     
-    def __init__(self, product_id, name, category, quantity, price, last_updated=None):
-        """Initialize a product
-        
-        Args:
-            product_id (str): Unique identifier for the product
-            name (str): Name of the product
-            category (str): Category of the product
-            quantity (int): Available quantity in inventory
-            price (float): Price per unit
-            last_updated (str, optional): Timestamp when product was last updated
-        """
-        self.product_id = product_id
-        self.name = name
-        self.category = category
-        self.quantity = quantity
-        self.price = price
-        self.last_updated = last_updated if last_updated else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    Attributes:
+        product_id (str): Unique identifier for the product
+        name (str): Name of the product
+        category (str): Category of the product
+        quantity (int): Available quantity in inventory
+        price (float): Price per unit
+        last_updated (str, optional): Timestamp when product was last updated
+    """
+    
+    product_id: str
+    name: str
+    category: str
+    quantity: int
+    price: float
+    last_updated: Optional[str] = None
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _total_value: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Normalize numeric fields, precompute the stock value and default the timestamp"""
+        self.quantity = int(self.quantity)
+        self.price = float(self.price)
+        self._total_value = self.quantity * self.price
+        if not self.last_updated:
+            self.last_updated = _now_str()
     
     def to_dict(self):
         """Convert product to dictionary for storage
         
+        The dictionary is cached until the product is modified, so callers
+        must treat it as read-only.
+        
         Returns:
             dict: Dictionary representation of product
         """
-        return {
-            "product_id": self.product_id,
-            "name": self.name,
-            "category": self.category,
-            "quantity": self.quantity,
-            "price": self.price,
-            "last_updated": self.last_updated
-        }
+        if self._dict_cache is None:
+            self._dict_cache = dict(zip(_PRODUCT_KEYS, (
+                self.product_id, self.name, self.category,
+                self.quantity, self.price, self.last_updated
+            )))
+        return self._dict_cache
     
     @classmethod
     def from_dict(cls, data):
@@ -63,38 +142,328 @@ class Product:
 class InventoryManager:
     """Class for managing the inventory of products"""
     
-    def __init__(self, file_path="inventory_data.json"):
+    def __init__(self, file_path="inventory_data.feather"):
         """Initialize the inventory manager
         
+        The inventory file is not read until the manager is first used.
+        
         Args:
-            file_path (str): Path to the JSON file for data storage
+            file_path (str): Path to the Feather file for data storage
         """
         self.file_path = file_path
+        self._log_path = file_path + ".log"
+        self._log_file = None
         self.products = {}
-        self.load_inventory()
+        # Lowercased word -> product IDs, plus the words in sorted order for prefix search
+        self._name_index = {}
+        self._cat_index = {}
+        self._name_tokens = []
+        self._cat_tokens = []
+        # Lowercased (name, category) per product and trigram -> product IDs for substring search
+        self._search_text = {}
+        self._trigrams = {}
+        self._low_stock_threshold = 5
+        self._low_stock_ids = set()
+        self._total_items = 0
+        self._total_value = 0.0
+        self._version = next(_VERSIONS)
+        self._batch_depth = 0
+        self._dirty = False
+        self._loaded = False
+        # Serializes access when one manager is shared between sessions;
+        # re-entrant so locked methods can call each other
+        self._lock = threading.RLock()
+    
+    def _ensure(self):
+        """Load the inventory on first use
+        
+        The manager only counts as loaded once the load succeeds, so a
+        failed load is retried on the next call.
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load_inventory()
+                    self._loaded = True
     
     def load_inventory(self):
-        """Load inventory data from file if it exists"""
-        if os.path.exists(self.file_path):
+        """Load inventory data from file if it exists
+        
+        If there is no Feather snapshot yet but a JSON snapshot from an older
+        version sits next to it, that one is loaded and migrated.
+        """
+        legacy_path = os.path.splitext(self.file_path)[0] + ".json"
+        self.products = {}
+        try:
+            df = pd.read_feather(self.file_path)
+            self.products = {
+                row.product_id: Product(**row._asdict())
+                for row in df.itertuples(index=False)
+            }
+        except FileNotFoundError:
+            if legacy_path != self.file_path:
+                self._migrate_json(legacy_path)
+        except (ValueError, TypeError, AttributeError) as e:
+            st.error(f"Error loading inventory data: {e}")
+            self.products = {}
+        self._replay_log(self._log_path)
+        self._build_indexes()
+        self._low_stock_ids = {
+            pid for pid, p in self.products.items()
+            if p.quantity <= self._low_stock_threshold
+        }
+        self._total_items = sum(p.quantity for p in self.products.values())
+        self._total_value = sum(p._total_value for p in self.products.values())
+        self._version = next(_VERSIONS)
+    
+    def _migrate_json(self, legacy_path):
+        """Load a JSON snapshot and its log, then rewrite them as Feather
+        
+        Args:
+            legacy_path (str): Path to the JSON snapshot
+        """
+        try:
+            with open(legacy_path, 'rb') as file:
+                if ijson is not None:
+                    items = ijson.kvitems(file, "", use_float=True)
+                else:
+                    items = _LOADS(file.read()).items()
+                self.products = {
+                    pid: Product.from_dict(pdata) 
+                    for pid, pdata in items
+                }
+        except FileNotFoundError:
+            return
+        except _JSON_ERRORS as e:
+            st.error(f"Error loading inventory data: {e}")
+            self.products = {}
+            return
+        self._replay_log(legacy_path + ".log")
+        self._write_snapshot()
+        try:
+            os.remove(legacy_path + ".log")
+        except FileNotFoundError:
+            pass
+    
+    def _replay_log(self, log_path):
+        """Apply mutations recorded in a log on top of the loaded snapshot
+        
+        A torn final line left by an interrupted write is cut off the log,
+        so the next appended record starts on a line of its own.
+        
+        Args:
+            log_path (str): Path to the mutation log
+        """
+        try:
+            file = open(log_path, 'rb')
+        except FileNotFoundError:
+            return
+        complete_size = 0
+        with file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                complete_size += len(line)
+                try:
+                    self._apply_record(_LOADS(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    st.error(f"Skipping invalid inventory log record: {e}")
+            torn = file.tell() != complete_size
+        if torn:
+            os.truncate(log_path, complete_size)
+    
+    def _apply_record(self, record):
+        """Apply one mutation record from the log
+        
+        Args:
+            record (dict): Mutation record with "op" and "id" keys
+        """
+        op = record["op"]
+        pid = record["id"]
+        if op == "add":
+            self.products[pid] = Product.from_dict(record["data"])
+        elif op == "upd" and pid in self.products:
+            product = self.products[pid]
+            for attr, value in record["fields"].items():
+                setattr(product, attr, value)
+            product.quantity = int(product.quantity)
+            product.price = float(product.price)
+            product._dict_cache = None
+            product._total_value = product.quantity * product.price
+        elif op == "del":
+            self.products.pop(pid, None)
+    
+    def _append_log(self, record):
+        """Append a single mutation record to the log
+        
+        Args:
+            record (dict): Mutation record with "op" and "id" keys
+        """
+        self._version = next(_VERSIONS)
+        if self._log_file is None:
+            self._log_file = open(self._log_path, 'ab', buffering=1 << 16)
+        self._log_file.write(_DUMPS(record) + b"\n")
+        if not self._batch_depth:
+            self._log_file.flush()
+            self._maybe_compact()
+    
+    def _maybe_compact(self):
+        """Compact the log once it grows past half the snapshot size"""
+        try:
+            snapshot_size = os.path.getsize(self.file_path)
+        except FileNotFoundError:
+            snapshot_size = 0
+        if os.path.getsize(self._log_path) > snapshot_size / 2:
+            self.compact()
+    
+    def compact(self):
+        """Fold the mutation log into the snapshot and truncate the log"""
+        self._ensure()
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self.save_inventory()
+        if self._log_file is not None:
+            self._log_file.close()
+        self._log_file = open(self._log_path, 'wb', buffering=1 << 16)
+    
+    @contextmanager
+    def batch(self):
+        """Group several mutations so the log is flushed and compacted once
+        
+        Snapshot writes requested inside the block are deferred until the
+        outermost batch exits.
+        
+        Example:
+            with manager.batch():
+                manager.update_product("P1", quantity=3)
+                manager.update_product("P2", quantity=7)
+        """
+        with self._lock:
+            self._batch_depth += 1
             try:
-                with open(self.file_path, 'r') as file:
-                    data = json.load(file)
-                    self.products = {
-                        pid: Product.from_dict(pdata) 
-                        for pid, pdata in data.items()
-                    }
-            except (json.JSONDecodeError, KeyError) as e:
-                st.error(f"Error loading inventory data: {e}")
-                self.products = {}
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    if self._log_file is not None:
+                        self._log_file.flush()
+                    if self._dirty:
+                        self._dirty = False
+                        self.compact()
+                    elif self._log_file is not None:
+                        self._maybe_compact()
     
-    def save_inventory(self):
-        """Save inventory data to file"""
-        data = {
-            pid: product.to_dict() 
-            for pid, product in self.products.items()
+    def _build_indexes(self):
+        """Rebuild the search indexes from the current products"""
+        self._name_index, self._cat_index = {}, {}
+        self._name_tokens, self._cat_tokens = [], []
+        self._search_text, self._trigrams = {}, {}
+        for product in self.products.values():
+            self._index_product(product)
+    
+    def _search_indexes(self, product):
+        """Pair each search index with the product text it covers"""
+        return (
+            (self._name_index, self._name_tokens, product.name),
+            (self._cat_index, self._cat_tokens, product.category),
+        )
+    
+    def _index_product(self, product):
+        """Add a product's name and category words to the search indexes"""
+        for index, tokens, text in self._search_indexes(product):
+            for token in text.lower().split():
+                ids = index.get(token)
+                if ids is None:
+                    ids = index[token] = set()
+                    bisect.insort(tokens, token)
+                ids.add(product.product_id)
+        
+        text = (product.name.lower(), product.category.lower())
+        self._search_text[product.product_id] = text
+        for trigram in _trigrams(*text):
+            self._trigrams.setdefault(trigram, set()).add(product.product_id)
+    
+    def _unindex_product(self, product):
+        """Remove a product's name and category words from the search indexes"""
+        for index, tokens, text in self._search_indexes(product):
+            for token in set(text.lower().split()):
+                ids = index.get(token)
+                if ids is None:
+                    continue
+                ids.discard(product.product_id)
+                if not ids:
+                    del index[token]
+                    del tokens[bisect.bisect_left(tokens, token)]
+        
+        text = self._search_text.pop(product.product_id, None)
+        if text is None:
+            return
+        for trigram in _trigrams(*text):
+            ids = self._trigrams[trigram]
+            ids.discard(product.product_id)
+            if not ids:
+                del self._trigrams[trigram]
+    
+    def _substring_match(self, query):
+        """Collect the IDs of products whose name or category contains query
+        
+        Queries of three or more characters only check the products that
+        contain every trigram of the query.
+        
+        Args:
+            query (str): Lowercased search term
+        """
+        query_trigrams = _trigrams(query)
+        if query_trigrams:
+            postings = sorted((self._trigrams.get(t, set()) for t in query_trigrams), key=len)
+            candidates = set.intersection(*postings)
+        else:
+            candidates = self._search_text.keys()
+        return {
+            pid for pid in candidates
+            if query in self._search_text[pid][0] or query in self._search_text[pid][1]
         }
-        with open(self.file_path, 'w') as file:
-            json.dump(data, file, indent=4)
+    
+    def _track_stock(self, product):
+        """Add or remove a product from the low stock set after a quantity change"""
+        if product.quantity <= self._low_stock_threshold:
+            self._low_stock_ids.add(product.product_id)
+        else:
+            self._low_stock_ids.discard(product.product_id)
+    
+    @staticmethod
+    def _prefix_match(index, tokens, prefix):
+        """Collect the IDs of every indexed word starting with prefix"""
+        ids = set()
+        for i in range(bisect.bisect_left(tokens, prefix), len(tokens)):
+            if not tokens[i].startswith(prefix):
+                break
+            ids |= index[tokens[i]]
+        return ids
+    
+    def save_inventory(self):
+        """Save a full snapshot of the inventory data to file
+        
+        The snapshot is written to a temporary file and swapped in with
+        os.replace, so a crash never leaves a half-written snapshot.
+        """
+        self._ensure()
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._write_snapshot()
+    
+    def _write_snapshot(self):
+        """Write the in-memory products to the snapshot file atomically"""
+        df = pd.DataFrame.from_records(
+            [product.to_dict() for product in self.products.values()],
+            columns=_PRODUCT_KEYS
+        )
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, 'wb', buffering=1 << 20) as file:
+            df.to_feather(file, compression="zstd")
+        os.replace(tmp_path, self.file_path)
     
     def add_product(self, product):
         """Add a new product to the inventory
@@ -105,12 +474,18 @@ class InventoryManager:
         Returns:
             bool: True if added successfully, False if product_id already exists
         """
-        if product.product_id in self.products:
-            return False
-        
-        self.products[product.product_id] = product
-        self.save_inventory()
-        return True
+        with self._lock:
+            self._ensure()
+            if product.product_id in self.products:
+                return False
+            
+            self.products[product.product_id] = product
+            self._total_items += product.quantity
+            self._total_value += product._total_value
+            self._index_product(product)
+            self._track_stock(product)
+            self._append_log({"op": "add", "id": product.product_id, "data": product.to_dict()})
+            return True
     
     def update_product(self, product_id, name=None, category=None, quantity=None, price=None):
         """Update an existing product
@@ -125,23 +500,41 @@ class InventoryManager:
         Returns:
             bool: True if updated successfully, False if product not found
         """
-        if product_id not in self.products:
-            return False
-        
-        product = self.products[product_id]
-        
-        if name is not None:
-            product.name = name
-        if category is not None:
-            product.category = category
+        # Normalize before any index or total is touched, so a bad value leaves no trace
         if quantity is not None:
-            product.quantity = quantity
+            quantity = int(quantity)
         if price is not None:
-            product.price = price
+            price = float(price)
+        
+        with self._lock:
+            self._ensure()
+            if product_id not in self.products:
+                return False
             
-        product.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.save_inventory()
-        return True
+            product = self.products[product_id]
+            fields = {}
+            self._unindex_product(product)
+            self._total_items -= product.quantity
+            self._total_value -= product._total_value
+            
+            if name is not None:
+                product.name = fields["name"] = name
+            if category is not None:
+                product.category = fields["category"] = category
+            if quantity is not None:
+                product.quantity = fields["quantity"] = quantity
+            if price is not None:
+                product.price = fields["price"] = price
+                
+            product.last_updated = fields["last_updated"] = _now_str()
+            product._dict_cache = None
+            product._total_value = product.quantity * product.price
+            self._total_items += product.quantity
+            self._total_value += product._total_value
+            self._index_product(product)
+            self._track_stock(product)
+            self._append_log({"op": "upd", "id": product_id, "fields": fields})
+            return True
     
     def delete_product(self, product_id):
         """Delete a product from inventory
@@ -152,12 +545,33 @@ class InventoryManager:
         Returns:
             bool: True if deleted successfully, False if product not found
         """
-        if product_id not in self.products:
-            return False
+        with self._lock:
+            self._ensure()
+            if product_id not in self.products:
+                return False
+            
+            product = self.products.pop(product_id)
+            self._total_items -= product.quantity
+            self._total_value -= product._total_value
+            self._unindex_product(product)
+            self._low_stock_ids.discard(product_id)
+            self._append_log({"op": "del", "id": product_id})
+            return True
+    
+    @property
+    def version(self):
+        """int: Number that changes whenever the inventory is loaded or modified"""
+        self._ensure()
+        return self._version
+    
+    def stats(self):
+        """Get aggregate statistics for the whole inventory
         
-        del self.products[product_id]
-        self.save_inventory()
-        return True
+        Returns:
+            tuple: (total number of items, total stock value)
+        """
+        self._ensure()
+        return self._total_items, self._total_value
     
     def get_product(self, product_id):
         """Get a product by ID
@@ -168,6 +582,7 @@ class InventoryManager:
         Returns:
             Product or None: Product if found, None otherwise
         """
+        self._ensure()
         return self.products.get(product_id)
     
     def get_all_products(self):
@@ -176,7 +591,9 @@ class InventoryManager:
         Returns:
             list: List of all products
         """
-        return list(self.products.values())
+        with self._lock:
+            self._ensure()
+            return list(self.products.values())
     
     def get_low_stock_products(self, threshold=5):
         """Get products with stock below threshold
@@ -187,22 +604,107 @@ class InventoryManager:
         Returns:
             list: List of products below threshold
         """
-        return [p for p in self.products.values() if p.quantity <= threshold]
+        with self._lock:
+            self._ensure()
+            if threshold != self._low_stock_threshold:
+                return [p for p in self.products.values() if p.quantity <= threshold]
+            return [self.products[pid] for pid in self._low_stock_ids]
+    
+    def get_low_stock_count(self):
+        """Get the number of products at or below the default stock threshold
+        
+        Returns:
+            int: Number of low stock products
+        """
+        self._ensure()
+        return len(self._low_stock_ids)
     
     def search_products(self, query):
         """Search products by name or category
         
+        A product matches if its name or category contains the query, or if
+        every word in the query starts a word in its name or category.
+        
         Args:
             query (str): Search term
             
         Returns:
             list: List of matching products
         """
-        query = query.lower()
-        return [
-            p for p in self.products.values() 
-            if query in p.name.lower() or query in p.category.lower()
-        ]
+        with self._lock:
+            self._ensure()
+            query = query.lower()
+            if not query:
+                return self.get_all_products()
+            
+            matches = None
+            for term in query.split():
+                ids = (self._prefix_match(self._name_index, self._name_tokens, term)
+                       | self._prefix_match(self._cat_index, self._cat_tokens, term))
+                matches = ids if matches is None else matches & ids
+            matches = (matches or set()) | self._substring_match(query)
+            return [p for pid, p in self.products.items() if pid in matches]
+
+
+@st.cache_resource
+def _get_manager():
+    """Get the inventory manager shared by all sessions
+    
+    Returns:
+        InventoryManager: Process-wide inventory manager
+    """
+    return InventoryManager()
+
+
+@st.cache_data(max_entries=32)
+def _search_df(_manager, query, version):
+    """Build the inventory table for a search query
+    
+    Cached on the query and the manager's version, so reruns with an
+    unchanged inventory reuse the previous table. Versions only grow, so
+    the cache is bounded and stale tables are evicted.
+    
+    Args:
+        _manager (InventoryManager): Manager to read from (not hashed)
+        query (str): Search term, or empty for all products
+        version (int): Current inventory version
+        
+    Returns:
+        pd.DataFrame: Table of matching products
+    """
+    products = _manager.search_products(query) if query else _manager.get_all_products()
+    
+    # Build typed column arrays up front so pandas has no dtypes to infer
+    count = len(products)
+    quantity = np.fromiter((p.quantity for p in products), dtype=np.int64, count=count)
+    price = np.fromiter((p.price for p in products), dtype=np.float64, count=count)
+    
+    # Columns are given in display order under their display names
+    return pd.DataFrame({
+        "ID": np.array([p.product_id for p in products], dtype=object),
+        "Product Name": np.array([p.name for p in products], dtype=object),
+        "Category": np.array([p.category for p in products], dtype=object),
+        "Quantity": quantity,
+        "Unit Price ($)": price,
+        "Total Value ($)": quantity * price,
+        "Last Updated": np.array([p.last_updated for p in products], dtype=object)
+    }, copy=False)
+
+
+@st.cache_data(max_entries=4)
+def _product_options(_manager, version):
+    """Build the product picker options shared by the Update and Delete tabs
+    
+    Only the current version is ever requested again, so few entries are kept.
+    
+    Args:
+        _manager (InventoryManager): Manager to read from (not hashed)
+        version (int): Current inventory version
+        
+    Returns:
+        dict: Display label mapped to product ID
+    """
+    return {f"{p.product_id} - {p.name}": p.product_id for p in _manager.get_all_products()}
 
 
 def main():
@@ -213,9 +715,8 @@ def main():
         layout="wide"
     )
     
-    # Initialize inventory manager in session state if it doesn't exist
-    if "inventory_manager" not in st.session_state:
-        st.session_state.inventory_manager = InventoryManager()
+    # Inventory manager shared by every session in this server process
+    manager = _get_manager()
     
     # Main title
     st.title("📦 Inventory Management System")
@@ -237,33 +738,12 @@ def main():
             is_searching = st.checkbox("Search")
         
         # Display inventory as a dataframe
-        if is_searching and search_query:
-            products = st.session_state.inventory_manager.search_products(search_query)
-            if not products:
-                st.info(f"No products found matching '{search_query}'")
-        else:
-            products = st.session_state.inventory_manager.get_all_products()
+        query = search_query if is_searching else ""
+        df = _search_df(manager, query, manager.version)
+        if query and df.empty:
+            st.info(f"No products found matching '{search_query}'")
         
-        if products:
-            # Convert products to dataframe for display
-            products_data = [p.to_dict() for p in products]
-            df = pd.DataFrame(products_data)
-            
-            # Add total value column
-            df["total_value"] = df["quantity"] * df["price"]
-            
-            # Reorder and format columns
-            df = df[["product_id", "name", "category", "quantity", "price", "total_value", "last_updated"]]
-            df = df.rename(columns={
-                "product_id": "ID",
-                "name": "Product Name",
-                "category": "Category",
-                "quantity": "Quantity",
-                "price": "Unit Price ($)",
-                "total_value": "Total Value ($)",
-                "last_updated": "Last Updated"
-            })
-            
+        if not df.empty:
             st.dataframe(df, use_container_width=True)
             
             # Show inventory statistics
@@ -271,15 +751,20 @@ def main():
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("Total Products", len(products))
+                st.metric("Total Products", len(df))
+            
+            if query:
+                total_items = int(df["Quantity"].sum())
+                total_value = float(df["Total Value ($)"].sum())
+            else:
+                total_items, total_value = manager.stats()
+            
             with col2:
-                total_items = sum(p.quantity for p in products)
                 st.metric("Total Items", total_items)
             with col3:
-                total_value = sum(p.quantity * p.price for p in products)
                 st.metric("Total Value ($)", f"{total_value:.2f}")
             with col4:
-                low_stock = len(st.session_state.inventory_manager.get_low_stock_products())
+                low_stock = manager.get_low_stock_count()
                 st.metric("Low Stock Items", low_stock)
             
             # Show low stock warning
@@ -302,7 +787,7 @@ def main():
             with col1:
                 category = st.selectbox(
                     "Category", 
-                    options=["Electronics", "Clothing", "Food", "Furniture", "Office Supplies", "Other"]
+                    options=CATEGORIES
                 )
             with col2:
                 quantity = st.number_input("Quantity", min_value=0, value=10)
@@ -327,7 +812,7 @@ def main():
                     )
                     
                     # Add to inventory
-                    if st.session_state.inventory_manager.add_product(new_product):
+                    if manager.add_product(new_product):
                         st.success(f"Product '{name}' added successfully!")
                         # Clear form
                         st.form_submit_button("Add Another Product")
@@ -339,8 +824,7 @@ def main():
         st.header("Update Product")
         
         # Get list of products for selection
-        products = st.session_state.inventory_manager.get_all_products()
-        product_options = {f"{p.product_id} - {p.name}": p.product_id for p in products}
+        product_options = _product_options(manager, manager.version)
         
         if not product_options:
             st.info("No products in inventory to update. Add products using the 'Add Product' tab.")
@@ -353,7 +837,7 @@ def main():
             selected_product_id = product_options[selected_product_display]
             
             # Get current product details
-            product = st.session_state.inventory_manager.get_product(selected_product_id)
+            product = manager.get_product(selected_product_id)
             
             if product:
                 with st.form("update_product_form"):
@@ -365,9 +849,8 @@ def main():
                     with col1:
                         category = st.selectbox(
                             "Category", 
-                            options=["Electronics", "Clothing", "Food", "Furniture", "Office Supplies", "Other"],
-                            index=["Electronics", "Clothing", "Food", "Furniture", "Office Supplies", "Other"].index(product.category)
-                            if product.category in ["Electronics", "Clothing", "Food", "Furniture", "Office Supplies", "Other"] else 5
+                            options=CATEGORIES,
+                            index=CATEGORY_IDX.get(product.category, OTHER)
                         )
                     with col2:
                         quantity = st.number_input("Quantity", min_value=0, value=product.quantity)
@@ -381,7 +864,7 @@ def main():
                             st.error("Product name is required!")
                         else:
                             # Update the product
-                            if st.session_state.inventory_manager.update_product(
+                            if manager.update_product(
                                 product_id=selected_product_id,
                                 name=name,
                                 category=category,
@@ -397,8 +880,7 @@ def main():
         st.header("Delete Product")
         
         # Get list of products for selection
-        products = st.session_state.inventory_manager.get_all_products()
-        product_options = {f"{p.product_id} - {p.name}": p.product_id for p in products}
+        product_options = _product_options(manager, manager.version)
         
         if not product_options:
             st.info("No products in inventory to delete. Add products using the 'Add Product' tab.")
@@ -411,7 +893,7 @@ def main():
             selected_product_id = product_options[selected_product_display]
             
             # Get current product details
-            product = st.session_state.inventory_manager.get_product(selected_product_id)
+            product = manager.get_product(selected_product_id)
             
             if product:
                 # Display product details
@@ -429,7 +911,7 @@ def main():
                 # Confirm deletion
                 st.warning("Are you sure you want to delete this product? This action cannot be undone.")
                 if st.button("Delete Product", type="primary"):
-                    if st.session_state.inventory_manager.delete_product(selected_product_id):
+                    if manager.delete_product(selected_product_id):
                         st.success(f"Product '{product.name}' deleted successfully!")
                         # Force a rerun to update the UI
                         st.rerun()
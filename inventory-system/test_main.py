@@ -0,0 +1,175 @@
+import os
+
+import pytest
+
+import main
+from main import InventoryManager, Product, _search_df
+
+
+@pytest.fixture
+def inventory_path(tmp_path):
+    """Path of a fresh inventory snapshot"""
+    return str(tmp_path / "inventory.feather")
+
+
+def reload(path):
+    """Open a new manager on the same files and load them"""
+    manager = InventoryManager(path)
+    manager.get_all_products()
+    return manager
+
+
+def test_log_round_trip(inventory_path):
+    manager = InventoryManager(inventory_path)
+    manager.add_product(Product("P1", "Desk Lamp", "Furniture", 10, 19.99))
+    manager.add_product(Product("P2", "Stapler", "Office Supplies", 3, 4.5))
+    manager.add_product(Product("P3", "Mug", "Other", 7, 2.0))
+    manager.update_product("P1", quantity=4, price=17.5)
+    manager.delete_product("P2")
+
+    reloaded = reload(inventory_path)
+    assert sorted(reloaded.products) == ["P1", "P3"]
+    assert reloaded.get_product("P1").quantity == 4
+    assert reloaded.get_product("P1").price == 17.5
+    assert reloaded.stats() == manager.stats()
+
+
+def test_replay_without_compaction(inventory_path):
+    manager = InventoryManager(inventory_path)
+    with manager.batch():
+        manager.add_product(Product("P1", "Desk Lamp", "Furniture", 10, 19.99))
+        manager.update_product("P1", name="Floor Lamp")
+        # Simulate a crash before the batch is compacted
+        manager._log_file.flush()
+        reloaded = reload(inventory_path)
+    assert reloaded.get_product("P1").name == "Floor Lamp"
+
+
+def test_compact_truncates_log(inventory_path):
+    manager = InventoryManager(inventory_path)
+    for i in range(20):
+        manager.add_product(Product(f"P{i}", f"Item {i}", "Food", i, 1.25))
+    manager.compact()
+    assert os.path.getsize(inventory_path + ".log") == 0
+
+    reloaded = reload(inventory_path)
+    assert len(reloaded.products) == 20
+    assert reloaded.get_product("P7").quantity == 7
+
+
+def test_torn_line_does_not_swallow_next_record(inventory_path):
+    manager = InventoryManager(inventory_path)
+    manager.add_product(Product("P1", "Desk Lamp", "Furniture", 10, 19.99))
+    manager._log_file.close()
+    with open(inventory_path + ".log", "ab") as file:
+        file.write(b'{"op":"upd","id":"P1","fie')
+
+    manager = reload(inventory_path)
+    manager.update_product("P1", quantity=2)
+
+    assert reload(inventory_path).get_product("P1").quantity == 2
+
+
+def test_invalid_record_is_skipped(inventory_path):
+    manager = InventoryManager(inventory_path)
+    manager.add_product(Product("P1", "Desk Lamp", "Furniture", 10, 19.99))
+    manager._log_file.close()
+    with open(inventory_path + ".log", "ab") as file:
+        file.write(b'{"op":"upd"}\n{"op":"del","id":"P1"}\n')
+
+    assert reload(inventory_path).get_product("P1") is None
+
+
+def test_search_table_handles_large_quantities(inventory_path):
+    manager = InventoryManager(inventory_path)
+    manager.add_product(Product("P1", "Bolt", "Other", 3_000_000_000, 0.01))
+    df = _search_df(manager, "", manager.version)
+    assert df["Quantity"].tolist() == [3_000_000_000]
+
+
+def test_search_matches_substrings_and_word_prefixes(inventory_path):
+    manager = InventoryManager(inventory_path)
+    manager.add_product(Product("P1", "Smartphone", "Electronics", 5, 299.0))
+    manager.add_product(Product("P2", "T-Shirt", "Clothing", 20, 9.99))
+    manager.add_product(Product("P3", "mama miaaa", "Food", 1, 0.01))
+    manager.add_product(Product("P4", "Desk Chair", "Office Supplies", 2, 89.0))
+
+    def ids(query):
+        return [p.product_id for p in manager.search_products(query)]
+
+    assert ids("phone") == ["P1"]
+    assert ids("shirt") == ["P2"]
+    assert ids("aaa") == ["P3"]
+    assert ids("tron") == ["P1"]
+    assert ids("oo") == ["P3"]
+    assert ids("office chair") == ["P4"]
+
+    manager.update_product("P1", name="Tablet")
+    assert ids("phone") == []
+    assert ids("table") == ["P1"]
+    manager.delete_product("P2")
+    assert ids("shirt") == []
+
+
+def test_products_compare_by_identity():
+    first = Product("P1", "Mug", "Other", 1, 2.0, "2025-01-01 00:00:00")
+    second = Product("P1", "Mug", "Other", 1, 2.0, "2025-01-01 00:00:00")
+    assert first != second
+    assert len({first, second}) == 2
+
+
+def test_failed_load_is_retried(inventory_path, monkeypatch):
+    manager = InventoryManager(inventory_path)
+    manager.add_product(Product("P1", "Mug", "Other", 1, 2.0))
+    manager.compact()
+
+    def fail(path):
+        raise OSError("disk unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(main.pd, "read_feather", fail)
+        manager = InventoryManager(inventory_path)
+        with pytest.raises(OSError):
+            manager.get_all_products()
+        with pytest.raises(OSError):
+            manager.add_product(Product("P2", "Pen", "Office Supplies", 9, 1.0))
+
+    assert [p.product_id for p in manager.get_all_products()] == ["P1"]
+    assert [p.product_id for p in reload(inventory_path).get_all_products()] == ["P1"]
+
+
+def test_legacy_json_is_migrated(tmp_path):
+    (tmp_path / "inventory.json").write_text(
+        '{"P1": {"product_id": "P1", "name": "Mug", "category": "Other",'
+        ' "quantity": 3, "price": 2.5, "last_updated": "2025-01-01 00:00:00"}}'
+    )
+    path = str(tmp_path / "inventory.feather")
+
+    assert reload(path).get_product("P1").quantity == 3
+    assert os.path.exists(path)
+
+
+def test_update_normalizes_numeric_fields(inventory_path):
+    manager = InventoryManager(inventory_path)
+    manager.add_product(Product("P1", "Desk Lamp", "Furniture", 10, 19.99))
+
+    assert manager.update_product("P1", name="Floor Lamp", quantity="7", price="2.5")
+    product = manager.get_product("P1")
+    assert (product.quantity, product.price) == (7, 2.5)
+    assert manager.stats() == (7, 17.5)
+    assert [p.product_id for p in manager.search_products("lamp")] == ["P1"]
+
+    with pytest.raises(ValueError):
+        manager.update_product("P1", name="Broken", quantity="lots")
+    assert manager.get_product("P1").name == "Floor Lamp"
+    assert manager.stats() == (7, 17.5)
+
+    reloaded = reload(inventory_path)
+    assert (reloaded.get_product("P1").quantity, reloaded.get_product("P1").price) == (7, 2.5)
+
+
+def test_search_keeps_inventory_order(inventory_path):
+    manager = InventoryManager(inventory_path)
+    for pid in ("P2", "P10", "P1"):
+        manager.add_product(Product(pid, f"Widget {pid}", "Other", 1, 1.0))
+    assert [p.product_id for p in manager.search_products("widget")] == ["P2", "P10", "P1"]